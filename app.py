@@ -5,47 +5,560 @@ It interprets emotions/text and generates movement parameters for the dots.
 """
 
 import os
-import json
-from flask import Flask, request, jsonify
-from flask_cors import CORS
-import google.generativeai as genai
+import re
+import atexit
+import hashlib
+import math
+import logging
+import queue
+import asyncio
+import copy
+import threading
+import time
+from collections import OrderedDict
+from logging.handlers import QueueHandler, QueueListener
+import numpy as np
+import orjson
+from quart import Quart, request, jsonify
+from quart.json.provider import DefaultJSONProvider
 from dotenv import load_dotenv
+import ahocorasick
 
 # Load environment variables from .env file
 load_dotenv()
 
-# Initialize Flask app
-app = Flask(__name__)
-CORS(app)  # Allow requests from your HTML file
+logger = logging.getLogger(__name__)
+_log_listener = None
+
+def configure_logging():
+    """Log through a queue so request handlers never block on writing to stderr
+    
+    A background listener thread does the actual output. Called when the
+    server starts rather than at import, so importing app leaves logging alone.
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s'))
+    _log_listener = QueueListener(log_queue, stream_handler)
+    
+    # Only the app's own logger; hypercorn and the root logger keep their handlers,
+    # and not propagating keeps our lines from being printed twice
+    logger.addHandler(QueueHandler(log_queue))
+    logger.propagate = False
+    
+    level = os.getenv('LOG_LEVEL', 'INFO').upper()
+    if isinstance(logging.getLevelName(level), int):
+        logger.setLevel(level)
+    else:
+        logger.setLevel(logging.INFO)
+        logger.warning("⚠️  Unknown LOG_LEVEL %r, using INFO", level)
+    
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson, used for request bodies and jsonify"""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+class EmotionApp(Quart):
+    json_provider_class = OrjsonProvider
+
+# Initialize Quart app (async, so waiting on Gemini doesn't tie up a worker thread)
+app = EmotionApp(__name__)
+
+@app.before_serving
+async def setup_logging():
+    """Set up logging before the other startup hooks run"""
+    configure_logging()
+
+# CORS lets your HTML file call the API; set ENABLE_CORS=0 when serving same-origin
+if os.getenv('ENABLE_CORS', '1') != '0':
+    from quart_cors import cors
+    app = cors(app)  # Allow requests from your HTML file
+
+# Static instructions, sent once as the model's system instruction
+SYSTEM_INSTRUCTION = """
+You will be given an emotion/feeling to analyze.
+
+Based on this emotion, create movement parameters for animated dots/particles that would visually represent this feeling.
+
+Consider:
+- How fast should dots move? (speed: 0.2 to 2.0)
+- How much should they cluster together? (cohesion: 0.0 to 0.3) 
+- How much should they avoid each other? (separation: 10 to 60)
+- How much random/organic movement? (curve: 0.0 to 1.0)
+
+Also suggest which behavior mode best fits:
+- "standard" - organic flowing
+- "predator" - chase/flee dynamics  
+- "swarm" - group movement
+- "spiral" - circular/spiral flow
+
+Respond ONLY with valid JSON in this exact format:
+{
+    "speed": 1.2,
+    "cohesion": 0.15,
+    "separation": 25,
+    "curve": 0.4,
+    "behavior": "standard",
+    "interpretation": "brief description of how this represents the emotion"
+}
+"""
+
+# Per-request prompt; only the emotion text changes
+PROMPT_TEMPLATE = 'Analyze this emotion/feeling: "{emotion_text}"'
 
 # Configure Google Gemini AI
 GEMINI_API_KEY = os.getenv('GEMINI_API_KEY')
 
 if not GEMINI_API_KEY:
-    print("⚠️  WARNING: No GEMINI_API_KEY found!")
-    print("📝 Create a .env file with: GEMINI_API_KEY=your_api_key_here")
-    print("🔗 Get your key from: https://makersuite.google.com/app/apikey")
-
-try:
-    genai.configure(api_key=GEMINI_API_KEY)
-    model = genai.GenerativeModel('gemini-pro')
-    print("✅ Google Gemini AI connected successfully!")
-except Exception as e:
-    print(f"❌ Gemini AI setup failed: {e}")
-    model = None
+    logger.warning("⚠️  WARNING: No GEMINI_API_KEY found!")
+    logger.warning("📝 Create a .env file with: GEMINI_API_KEY=your_api_key_here")
+    logger.warning("🔗 Get your key from: https://makersuite.google.com/app/apikey")
+
+# The Gemini SDK pulls in grpc and protobuf, so it's imported in a worker thread
+# on first use. Startup warm-up loads it in the background; set WARM_UP_GEMINI=0
+# (e.g. on serverless) to only load it when a request needs it.
+GEMINI_MODEL = os.getenv('GEMINI_MODEL', 'gemini-1.5-flash')
+VALID_BEHAVIORS = ['standard', 'predator', 'swarm', 'spiral']
+# Structured output: Gemini is constrained to emit JSON matching this schema
+PATTERN_SCHEMA = {
+    'type': 'object',
+    'properties': {
+        'speed': {'type': 'number'},
+        'cohesion': {'type': 'number'},
+        'separation': {'type': 'number'},
+        'curve': {'type': 'number'},
+        'behavior': {'type': 'string', 'format': 'enum', 'enum': VALID_BEHAVIORS},
+        'interpretation': {'type': 'string'}
+    },
+    'required': ['speed', 'cohesion', 'separation', 'curve', 'behavior', 'interpretation']
+}
+GENERATION_CONFIG = {
+    'temperature': 0.2,
+    'response_mime_type': 'application/json',
+    'response_schema': PATTERN_SCHEMA
+}
+WARM_UP_GEMINI = os.getenv('WARM_UP_GEMINI', '1') != '0'
+_model = None
+_model_failed = False
+_model_loading = None  # task loading the SDK, started by the first caller
+
+def load_model():
+    """Import and configure the Gemini SDK (blocking, so run off the event loop)"""
+    global _model, _model_failed
+    try:
+        import google.generativeai as genai
+        genai.configure(api_key=GEMINI_API_KEY)
+        _model = genai.GenerativeModel(
+            GEMINI_MODEL,
+            generation_config=GENERATION_CONFIG,
+            system_instruction=SYSTEM_INSTRUCTION
+        )
+        logger.info("✅ Google Gemini AI connected successfully!")
+    except Exception as e:
+        logger.error("❌ Gemini AI setup failed: %s", e)
+        _model_failed = True
+
+async def get_model():
+    """Return the Gemini model, loading the SDK in a worker thread on first call"""
+    global _model_loading
+    if _model_loading is None:
+        _model_loading = asyncio.ensure_future(asyncio.to_thread(load_model))
+    # Requests that arrive during the load all wait on the same one; shield it
+    # so a cancelled request doesn't cancel the load for everyone else
+    await asyncio.shield(_model_loading)
+    return _model
+
+# Seconds to wait on the warm-up call, which isn't retried; the SDK default
+# is 60s per attempt with retries
+WARM_UP_TIMEOUT = 5
+
+async def warm_up_gemini():
+    """Open the Gemini channel so the first request doesn't pay for it"""
+    model = await get_model()
+    if not model:
+        return
+    try:
+        # Token counting is free and goes through the same async client as generation
+        await model.count_tokens_async("warmup", request_options={
+            'timeout': WARM_UP_TIMEOUT,
+            'retry': None
+        })
+        logger.info("🔥 Gemini connection warmed up")
+    except Exception as e:
+        logger.warning("⚠️  Gemini warm-up failed: %s", e)
+
+@app.before_serving
+async def start_gemini_warm_up():
+    """Warm up Gemini in the background so startup doesn't wait on the network"""
+    if WARM_UP_GEMINI:
+        app.add_background_task(warm_up_gemini)
+
+# Exact-match cache for AI results, keyed on normalized emotion text
+AI_CACHE_SIZE = 4096
+_ai_cache = OrderedDict()
+_ai_cache_lock = threading.Lock()
+
+def normalize_emotion(emotion_text):
+    """Normalize emotion text for cache lookups"""
+    return emotion_text.strip().lower()
+
+def get_cached_pattern(emotion_text):
+    """Return a copy of the cached pattern for this emotion, or None"""
+    key = normalize_emotion(emotion_text)
+    with _ai_cache_lock:
+        cached = _ai_cache.get(key)
+        if cached is None:
+            return None
+        _ai_cache.move_to_end(key)
+    return copy.deepcopy(cached)
+
+def cache_pattern(emotion_text, pattern_data):
+    """Store a pattern in the cache, evicting the least recently used entry"""
+    key = normalize_emotion(emotion_text)
+    with _ai_cache_lock:
+        _ai_cache[key] = copy.deepcopy(pattern_data)
+        _ai_cache.move_to_end(key)
+        while len(_ai_cache) > AI_CACHE_SIZE:
+            _ai_cache.popitem(last=False)
+
+# Semantic cache: near-duplicate emotions ("very happy" / "so happy") reuse a pattern
+EMBEDDING_MODEL = 'models/text-embedding-004'
+SEMANTIC_CACHE_SIZE = 2048
+SEMANTIC_THRESHOLD = 0.92
+_semantic_vectors = None  # (SEMANTIC_CACHE_SIZE, D) unit-length embeddings, allocated once
+_semantic_entries = []    # pattern data for the filled rows of _semantic_vectors
+_semantic_last_used = []  # LRU clock value per row
+_semantic_clock = 0
+_semantic_lock = threading.Lock()
+
+async def embed_emotion(emotion_text):
+    """Embed emotion text as a unit vector, or None if embedding fails"""
+    import google.generativeai as genai
+    try:
+        result = await genai.embed_content_async(
+            model=EMBEDDING_MODEL,
+            content=normalize_emotion(emotion_text),
+            task_type='semantic_similarity'
+        )
+        vector = np.asarray(result['embedding'], dtype=np.float32)
+    except Exception as e:
+        logger.warning("⚠️  Embedding failed, skipping semantic cache: %s", e)
+        return None
+    
+    norm = np.linalg.norm(vector)
+    if norm == 0:
+        return None
+    return vector / norm
+
+def get_similar_pattern(vector):
+    """Return a copy of the closest cached pattern above the threshold, or None"""
+    global _semantic_clock
+    with _semantic_lock:
+        if not _semantic_entries:
+            return None
+        # Rows and query are unit vectors, so the dot product is the cosine similarity
+        scores = np.einsum('ij,j->i', _semantic_vectors[:len(_semantic_entries)], vector)
+        best = int(np.argmax(scores))
+        if scores[best] <= SEMANTIC_THRESHOLD:
+            return None
+        _semantic_clock += 1
+        _semantic_last_used[best] = _semantic_clock
+        cached = _semantic_entries[best]
+    return copy.deepcopy(cached)
+
+def cache_similar_pattern(vector, pattern_data):
+    """Add an embedding and its pattern, replacing the least recently used row when full"""
+    global _semantic_vectors, _semantic_clock
+    with _semantic_lock:
+        _semantic_clock += 1
+        entry = copy.deepcopy(pattern_data)
+        if _semantic_vectors is None:
+            # Rows are written in place, so inserts never copy the matrix
+            _semantic_vectors = np.empty((SEMANTIC_CACHE_SIZE, len(vector)), dtype=np.float32)
+        if len(_semantic_entries) < SEMANTIC_CACHE_SIZE:
+            row = len(_semantic_entries)
+            _semantic_entries.append(entry)
+            _semantic_last_used.append(_semantic_clock)
+        else:
+            row = int(np.argmin(_semantic_last_used))
+            _semantic_entries[row] = entry
+            _semantic_last_used[row] = _semantic_clock
+        _semantic_vectors[row] = vector
+
+# Shared cache in Redis, so every worker sees the same hits and they survive restarts.
+# Only used when REDIS_URL is set; the semantic tier needs Redis Stack (RediSearch).
+REDIS_URL = os.getenv('REDIS_URL')
+REDIS_TTL = 86400
+REDIS_TIMEOUT = 0.25     # seconds; a slow cache is worse than no cache
+REDIS_RETRY_AFTER = 30   # seconds to skip Redis after it fails to respond
+REDIS_PATTERN_PREFIX = 'emo:'
+REDIS_VECTOR_PREFIX = 'emovec:'
+REDIS_VECTOR_INDEX = 'emo_vec_idx'
+_redis = None
+_redis_down_until = 0.0
+_redis_vector_index = None  # None until checked, then whether vector search works
+
+def get_redis():
+    """Return the shared Redis client, or None if Redis isn't configured or is down"""
+    global _redis
+    if not REDIS_URL or time.monotonic() < _redis_down_until:
+        return None
+    if _redis is None:
+        import redis.asyncio
+        _redis = redis.asyncio.from_url(
+            REDIS_URL,
+            socket_connect_timeout=REDIS_TIMEOUT,
+            socket_timeout=REDIS_TIMEOUT
+        )
+    return _redis
+
+def redis_failed(action, e):
+    """Log a Redis failure, and stop using Redis for a while if it's unreachable"""
+    global _redis_down_until
+    import redis.exceptions
+    if isinstance(e, (redis.exceptions.ConnectionError, redis.exceptions.TimeoutError, OSError)):
+        _redis_down_until = time.monotonic() + REDIS_RETRY_AFTER
+        logger.warning("⚠️  Redis %s failed, skipping Redis for %ds: %s", action, REDIS_RETRY_AFTER, e)
+    else:
+        logger.warning("⚠️  Redis %s failed: %s", action, e)
+
+def load_shared_pattern(data):
+    """Parse pattern data stored in Redis, raising ValueError if it's malformed"""
+    pattern_data = orjson.loads(data)
+    if not isinstance(pattern_data, dict) or not isinstance(pattern_data.get('pattern'), dict) \
+            or 'interpretation' not in pattern_data:
+        raise ValueError("malformed pattern data")
+    return pattern_data
+
+def redis_key(prefix, emotion_text):
+    """Fixed-length Redis key for an emotion"""
+    digest = hashlib.blake2b(normalize_emotion(emotion_text).encode(), digest_size=16).hexdigest()
+    return prefix + digest
+
+async def get_shared_pattern(emotion_text):
+    """Return the pattern another worker cached for this emotion, or None"""
+    client = get_redis()
+    if client is None:
+        return None
+    try:
+        cached = await client.get(redis_key(REDIS_PATTERN_PREFIX, emotion_text))
+        return load_shared_pattern(cached) if cached is not None else None
+    except Exception as e:
+        redis_failed("lookup", e)
+        return None
+
+async def ensure_redis_vector_index(client, dimensions):
+    """Create the HNSW vector index on first use; False if vector search isn't available"""
+    global _redis_vector_index
+    if _redis_vector_index is not None:
+        return _redis_vector_index
+    from redis.exceptions import ResponseError
+    from redis.commands.search.field import VectorField
+    from redis.commands.search.indexDefinition import IndexDefinition, IndexType
+    try:
+        await client.ft(REDIS_VECTOR_INDEX).info()
+    except ResponseError:
+        try:
+            await client.ft(REDIS_VECTOR_INDEX).create_index(
+                # Only the vector is indexed; the pattern JSON rides along in the hash
+                [
+                    VectorField('vec', 'HNSW', {
+                        'TYPE': 'FLOAT32',
+                        'DIM': dimensions,
+                        'DISTANCE_METRIC': 'COSINE'
+                    })
+                ],
+                definition=IndexDefinition(prefix=[REDIS_VECTOR_PREFIX], index_type=IndexType.HASH)
+            )
+        except ResponseError as e:
+            # Another worker may have just created it; anything else means no RediSearch
+            if 'already exists' not in str(e).lower():
+                logger.warning("⚠️  Redis vector search unavailable, skipping shared semantic cache: %s", e)
+                _redis_vector_index = False
+                return False
+    _redis_vector_index = True
+    return True
+
+async def get_shared_similar_pattern(vector):
+    """Return the closest pattern in Redis above the threshold, or None"""
+    client = get_redis()
+    if client is None or _redis_vector_index is False:
+        return None
+    from redis.commands.search.query import Query
+    query = (
+        Query('*=>[KNN 1 @vec $q AS score]')
+        .sort_by('score')
+        .return_fields('score', 'data')
+        .dialect(2)
+    )
+    try:
+        if not await ensure_redis_vector_index(client, len(vector)):
+            return None
+        result = await client.ft(REDIS_VECTOR_INDEX).search(query, {'q': vector.tobytes()})
+        if not result.docs:
+            return None
+        # COSINE is reported as a distance: 1 - similarity
+        best = result.docs[0]
+        if 1 - float(best.score) <= SEMANTIC_THRESHOLD:
+            return None
+        return load_shared_pattern(best.data)
+    except Exception as e:
+        redis_failed("vector search", e)
+        return None
+
+async def cache_shared_pattern(emotion_text, vector, pattern_data):
+    """Store a pattern (and its embedding, if any) in Redis for every worker"""
+    client = get_redis()
+    if client is None:
+        return
+    data = orjson.dumps(pattern_data)
+    try:
+        store_vector = vector is not None and await ensure_redis_vector_index(client, len(vector))
+        # One round trip for all the writes
+        pipe = client.pipeline(transaction=False)
+        pipe.setex(redis_key(REDIS_PATTERN_PREFIX, emotion_text), REDIS_TTL, data)
+        if store_vector:
+            key = redis_key(REDIS_VECTOR_PREFIX, emotion_text)
+            pipe.hset(key, mapping={'vec': vector.tobytes(), 'data': data})
+            pipe.expire(key, REDIS_TTL)
+        await pipe.execute()
+    except Exception as e:
+        redis_failed("store", e)
+
+# Program cache: short single-word/phrase emotions the keyword table knows are
+# answered deterministically. Gemini answers aren't learned here; repeats of those
+# are already served by the exact-match cache.
+SHORT_EMOTION_RE = re.compile(r'^[a-zA-Z ,!.-]{1,40}$')
+SHORT_EMOTION_MAX_WORDS = 2
+WORD_RE = re.compile(r'[a-z]+')
+# Words that only strengthen an emotion, so "very happy" is still just joy.
+# Anything else ("not happy", "never angry") could change the meaning.
+INTENSIFIER_WORDS = frozenset({'very', 'so', 'really', 'super', 'extremely', 'incredibly',
+                               'totally', 'truly', 'deeply', 'utterly', 'completely', 'quite',
+                               'absolutely', 'too'})
+
+def is_short_emotion(emotion_text):
+    """Whether the emotion is a short single-word/phrase input"""
+    text = emotion_text.strip()
+    return len(text.split()) <= SHORT_EMOTION_MAX_WORDS and bool(SHORT_EMOTION_RE.match(text))
+
+def analyze_emotion_program(emotion_text):
+    """Answer short emotions without Gemini, or None if no program applies"""
+    if not is_short_emotion(emotion_text):
+        return None
+    
+    # The keyword table is a validated program only when it understands every word
+    words = WORD_RE.findall(emotion_text.lower())
+    if not all(word in EMOTION_WORDS or word in INTENSIFIER_WORDS for word in words):
+        return None
+    return analyze_emotion_simple(emotion_text, require_match=True)
+
+# Batch endpoint limits
+MAX_BATCH = 100
+BATCH_CONCURRENCY = 8
+SEQUENTIAL_BATCH_SIZE = 5
 
 def safe_float(value, default=0.5, min_val=0.0, max_val=2.0):
     """Safely convert to float with bounds"""
     try:
         result = float(value)
-        return max(min_val, min(max_val, result))
     except (ValueError, TypeError):
         return default
+    if math.isnan(result):
+        return default
+    return max(min_val, min(max_val, result))
+
+# Numeric pattern fields as (default, min, max), in a fixed column order.
+# All floats, so the single and batch cleaning paths return the same types.
+PATTERN_BOUNDS = {
+    'speed': (1.0, 0.2, 2.0),
+    'cohesion': (0.12, 0.0, 0.3),
+    'separation': (25.0, 10.0, 60.0),
+    'curve': (0.3, 0.0, 1.0)
+}
+PATTERN_FIELDS = tuple(PATTERN_BOUNDS)
+PATTERN_DEFAULTS = np.array([bounds[0] for bounds in PATTERN_BOUNDS.values()])
+PATTERN_MIN = np.array([bounds[1] for bounds in PATTERN_BOUNDS.values()])
+PATTERN_MAX = np.array([bounds[2] for bounds in PATTERN_BOUNDS.values()])
+
+def build_pattern_data(emotion_text, ai_data, values):
+    """Combine cleaned numeric values with the AI's behavior and interpretation"""
+    pattern = dict(zip(PATTERN_FIELDS, values))
+    
+    # Ensure behavior is valid
+    behavior = ai_data.get('behavior', 'standard')
+    pattern['behavior'] = behavior if behavior in VALID_BEHAVIORS else 'standard'
+    
+    return {
+        'pattern': pattern,
+        'interpretation': ai_data.get('interpretation', f'AI interpretation of "{emotion_text}"')
+    }
+
+def clean_ai_data(emotion_text, ai_data):
+    """Validate and clean one AI response"""
+    values = [
+        safe_float(ai_data.get(field, default), default, min_val, max_val)
+        for field, (default, min_val, max_val) in PATTERN_BOUNDS.items()
+    ]
+    return build_pattern_data(emotion_text, ai_data, values)
+
+def clean_ai_data_or_fallback(emotion_text, ai_data):
+    """Clean one AI response, using the simple analyzer if it can't be cleaned"""
+    try:
+        return clean_ai_data(emotion_text, ai_data)
+    except Exception as e:
+        logger.warning("⚠️  Failed to clean AI response, using fallback: %s", e)
+        return analyze_emotion_simple(emotion_text)
+
+def clean_ai_data_batch(emotion_texts, ai_data_list):
+    """Validate and clean many AI responses with one vectorized clip
+    
+    Gives the same output as calling clean_ai_data on each response.
+    """
+    if not ai_data_list:
+        return []
+    
+    raw = [
+        [ai_data.get(field, default) for field, default in zip(PATTERN_FIELDS, PATTERN_DEFAULTS)]
+        for ai_data in ai_data_list
+    ]
+    try:
+        values = np.array(raw, dtype=np.float64)
+    except (ValueError, TypeError):
+        values = None
+    if values is None or values.shape != (len(raw), len(PATTERN_FIELDS)):
+        # Some value isn't a plain number (a string, or same-shaped lists that numpy
+        # would turn into an extra axis): convert one by one, leaving NaN for the bad ones
+        values = np.array([[safe_float(value, np.nan, -np.inf, np.inf) for value in row] for row in raw])
+    
+    values = np.where(np.isnan(values), PATTERN_DEFAULTS, values)
+    values = np.clip(values, PATTERN_MIN, PATTERN_MAX)
+    
+    return [
+        build_pattern_data(emotion_text, ai_data, row)
+        for emotion_text, ai_data, row in zip(emotion_texts, ai_data_list, values.tolist())
+    ]
 
 @app.route('/health', methods=['GET'])
-def health_check():
+async def health_check():
     """Check if API is working"""
-    ai_status = "connected" if model else "disconnected"
+    # Don't load the SDK just to answer a health check
+    if _model:
+        ai_status = "connected"
+    elif _model_failed:
+        ai_status = "disconnected"
+    else:
+        ai_status = "not loaded"
     return jsonify({
         'status': 'healthy',
         'ai_model': ai_status,
@@ -53,213 +566,391 @@ def health_check():
     })
 
 @app.route('/generate-emotion-pattern', methods=['POST'])
-def generate_emotion_pattern():
+async def generate_emotion_pattern():
     """
     Main endpoint: Takes emotion/text and returns dot movement parameters
     """
     try:
         # Get the request data
-        data = request.get_json()
+        data = await request.get_json()
         emotion_text = data.get('emotion', '').strip()
         
         if not emotion_text:
             return jsonify({'error': 'Please provide emotion text'}), 400
         
-        print(f"🎭 Analyzing emotion: '{emotion_text}'")
+        result = await analyze_emotion(emotion_text)
         
-        # Try to use AI first, fallback to simple analysis
-        if model:
-            try:
-                # Use Google Gemini to analyze the emotion
-                pattern_data = analyze_emotion_with_ai(emotion_text)
-            except Exception as e:
-                print(f"⚠️  AI failed, using fallback: {e}")
-                pattern_data = analyze_emotion_simple(emotion_text)
-        else:
-            # Use simple analysis if no AI
-            pattern_data = analyze_emotion_simple(emotion_text)
+        return jsonify({'success': True, **result})
         
-        print(f"✅ Generated pattern: {pattern_data['interpretation']}")
+    except Exception as e:
+        logger.exception("❌ Error generating pattern: %s", e)
+        return jsonify({'error': f'Failed to generate pattern: {str(e)}'}), 500
+
+@app.route('/generate-emotion-pattern/batch', methods=['POST'])
+async def generate_emotion_pattern_batch():
+    """
+    Batch endpoint: Takes a list of emotions and returns a pattern for each,
+    running the Gemini calls concurrently
+    """
+    try:
+        data = await request.get_json(silent=True)
+        if not isinstance(data, dict):
+            return jsonify({'error': 'Request body must be a JSON object'}), 400
+        
+        emotions = data.get('emotions')
+        
+        if not isinstance(emotions, list) or not emotions:
+            return jsonify({'error': 'Please provide a list of emotions'}), 400
+        
+        if len(emotions) > MAX_BATCH:
+            return jsonify({'error': f'At most {MAX_BATCH} emotions per batch'}), 400
+        
+        if not all(isinstance(emotion, str) for emotion in emotions):
+            return jsonify({'error': 'Every emotion must be a string'}), 400
+        
+        emotion_texts = [emotion.strip() for emotion in emotions]
+        if not all(emotion_texts):
+            return jsonify({'error': 'Emotion text cannot be empty'}), 400
+        
+        logger.debug("🎭 Analyzing batch of %d emotions", len(emotion_texts))
+        
+        # Small batches aren't worth the scheduling overhead
+        if len(emotion_texts) <= SEQUENTIAL_BATCH_SIZE:
+            results = [await analyze_emotion(text) for text in emotion_texts]
+        else:
+            results = await analyze_emotions(emotion_texts)
         
         return jsonify({
             'success': True,
-            'emotion': emotion_text,
-            'pattern': pattern_data['pattern'],
-            'interpretation': pattern_data['interpretation'],
-            'ai_used': model is not None
+            'results': results
         })
         
     except Exception as e:
-        print(f"❌ Error generating pattern: {e}")
-        return jsonify({'error': f'Failed to generate pattern: {str(e)}'}), 500
+        logger.exception("❌ Error generating batch patterns: %s", e)
+        return jsonify({'error': f'Failed to generate patterns: {str(e)}'}), 500
+
+async def analyze_emotion(emotion_text):
+    """Generate the pattern for one emotion, returning the API response fields"""
+    
+    logger.debug("🎭 Analyzing emotion: '%s'", emotion_text)
+    
+    # Short emotions are handled by the program cache, otherwise
+    # try to use AI first, fallback to simple analysis
+    program_data = analyze_emotion_program(emotion_text)
+    model = await get_model() if program_data is None else None
+    if program_data is not None:
+        pattern_data = program_data
+    elif model:
+        try:
+            # Use Google Gemini to analyze the emotion
+            pattern_data = await analyze_emotion_with_ai(emotion_text)
+        except Exception as e:
+            logger.warning("⚠️  AI failed, using fallback: %s", e)
+            pattern_data = analyze_emotion_simple(emotion_text)
+    else:
+        # Use simple analysis if no AI
+        pattern_data = analyze_emotion_simple(emotion_text)
+    
+    logger.debug("✅ Generated pattern: %s", pattern_data['interpretation'])
+    
+    return {
+        'emotion': emotion_text,
+        'pattern': pattern_data['pattern'],
+        'interpretation': pattern_data['interpretation'],
+        'ai_used': model is not None
+    }
+
+async def analyze_emotions(emotion_texts):
+    """Generate patterns for many emotions, returning the API response fields for each"""
+    
+    # Short emotions are handled by the program cache, the rest go to the AI
+    pattern_data_list = [analyze_emotion_program(text) for text in emotion_texts]
+    ai_indices = [i for i, pattern_data in enumerate(pattern_data_list) if pattern_data is None]
+    ai_texts = [emotion_texts[i] for i in ai_indices]
+    
+    model = await get_model() if ai_indices else None
+    if model:
+        ai_results = await analyze_emotions_with_ai(ai_texts)
+    else:
+        # Use simple analysis if no AI
+        ai_results = [analyze_emotion_simple(text) for text in ai_texts]
+    
+    for i, pattern_data in zip(ai_indices, ai_results):
+        pattern_data_list[i] = pattern_data
+    
+    ai_used = set(ai_indices) if model else set()
+    return [
+        {
+            'emotion': emotion_text,
+            'pattern': pattern_data['pattern'],
+            'interpretation': pattern_data['interpretation'],
+            'ai_used': i in ai_used
+        }
+        for i, (emotion_text, pattern_data) in enumerate(zip(emotion_texts, pattern_data_list))
+    ]
+
+async def find_cached_pattern(emotion_text):
+    """Check the exact and semantic caches, returning (pattern data or None, embedding)"""
+    
+    # Skip the Gemini call entirely if we've seen this emotion before
+    cached = get_cached_pattern(emotion_text)
+    if cached is not None:
+        logger.debug("⚡ Cache hit for: '%s'", emotion_text)
+        return cached, None
+    
+    # Another worker may already have asked Gemini about it
+    shared = await get_shared_pattern(emotion_text)
+    if shared is not None:
+        logger.debug("⚡ Shared cache hit for: '%s'", emotion_text)
+        cache_pattern(emotion_text, shared)
+        return shared, None
+    
+    # Reuse the pattern of a near-duplicate emotion if we have one
+    vector = await embed_emotion(emotion_text)
+    if vector is not None:
+        similar = get_similar_pattern(vector)
+        if similar is None:
+            similar = await get_shared_similar_pattern(vector)
+            if similar is not None:
+                cache_similar_pattern(vector, similar)
+        if similar is not None:
+            logger.debug("⚡ Semantic cache hit for: '%s'", emotion_text)
+            cache_pattern(emotion_text, similar)
+            return similar, vector
+    
+    return None, vector
+
+async def fetch_ai_data(emotion_text):
+    """Ask Gemini for the raw pattern fields of an emotion"""
+    
+    # The instructions live in the system instruction, so only the emotion is sent
+    prompt = PROMPT_TEMPLATE.format(emotion_text=emotion_text)
+    
+    # Generate response with Gemini
+    model = await get_model()
+    response = await model.generate_content_async(prompt)
+    
+    # The response schema guarantees the whole response is our JSON object
+    response_text = response.text
+    logger.debug("AI Response: %s", response_text)
+    ai_data = orjson.loads(response_text)
+    if not isinstance(ai_data, dict):
+        raise ValueError("AI response is not a JSON object")
+    return ai_data
 
-def analyze_emotion_with_ai(emotion_text):
+def remember_pattern(emotion_text, vector, pattern_data):
+    """Store a fresh AI pattern in every cache tier"""
+    cache_pattern(emotion_text, pattern_data)
+    if vector is not None:
+        cache_similar_pattern(vector, pattern_data)
+    # The response doesn't depend on the Redis write, so don't make it wait
+    if get_redis() is not None:
+        app.add_background_task(cache_shared_pattern, emotion_text, vector, pattern_data)
+
+async def analyze_emotion_with_ai(emotion_text):
     """Use Google Gemini AI to analyze emotion and create pattern"""
     
-    # Create a detailed prompt for the AI
-    prompt = f"""
-    Analyze this emotion/feeling: "{emotion_text}"
-    
-    Based on this emotion, create movement parameters for animated dots/particles that would visually represent this feeling.
-    
-    Consider:
-    - How fast should dots move? (speed: 0.2 to 2.0)
-    - How much should they cluster together? (cohesion: 0.0 to 0.3) 
-    - How much should they avoid each other? (separation: 10 to 60)
-    - How much random/organic movement? (curve: 0.0 to 1.0)
-    
-    Also suggest which behavior mode best fits:
-    - "standard" - organic flowing
-    - "predator" - chase/flee dynamics  
-    - "swarm" - group movement
-    - "spiral" - circular/spiral flow
-    
-    Respond ONLY with valid JSON in this exact format:
-    {{
-        "speed": 1.2,
-        "cohesion": 0.15,
-        "separation": 25,
-        "curve": 0.4,
-        "behavior": "standard",
-        "interpretation": "brief description of how this represents the emotion"
-    }}
+    cached, vector = await find_cached_pattern(emotion_text)
+    if cached is not None:
+        return cached
+    
+    ai_data = await fetch_ai_data(emotion_text)
+    pattern_data = clean_ai_data(emotion_text, ai_data)
+    remember_pattern(emotion_text, vector, pattern_data)
+    
+    return pattern_data
+
+async def analyze_emotions_with_ai(emotion_texts):
+    """Batch version of analyze_emotion_with_ai
+    
+    Gemini calls run concurrently, and all the responses are cleaned
+    together once they've arrived. Repeated emotions are only looked up once.
     """
     
-    # Generate response with Gemini
-    response = model.generate_content(prompt)
-    response_text = response.text.strip()
+    # Repeats would all miss the cache at the same time, so group them first
+    unique = {}
+    for text in emotion_texts:
+        unique.setdefault(normalize_emotion(text), text)
+    unique_texts = list(unique.values())
+    
+    # Cap in-flight Gemini calls to stay clear of rate limits
+    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+    
+    async def lookup_or_fetch(emotion_text):
+        async with semaphore:
+            vector = None
+            try:
+                cached, vector = await find_cached_pattern(emotion_text)
+                if cached is not None:
+                    return cached, None, vector
+                return None, await fetch_ai_data(emotion_text), vector
+            except Exception as e:
+                logger.warning("⚠️  AI failed, using fallback: %s", e)
+                return analyze_emotion_simple(emotion_text), None, vector
     
-    print(f"AI Response: {response_text}")
+    fetched = await asyncio.gather(*[lookup_or_fetch(text) for text in unique_texts])
     
-    # Extract JSON from response
+    results = [pattern_data for pattern_data, _, _ in fetched]
+    pending = [i for i, (pattern_data, _, _) in enumerate(fetched) if pattern_data is None]
     try:
-        # Find JSON in the response
-        start = response_text.find('{')
-        end = response_text.rfind('}') + 1
-        
-        if start >= 0 and end > start:
-            json_str = response_text[start:end]
-            ai_data = json.loads(json_str)
-            
-            # Validate and clean the data
-            pattern = {
-                'speed': safe_float(ai_data.get('speed', 1.0), 1.0, 0.2, 2.0),
-                'cohesion': safe_float(ai_data.get('cohesion', 0.12), 0.12, 0.0, 0.3),
-                'separation': safe_float(ai_data.get('separation', 25), 25, 10, 60),
-                'curve': safe_float(ai_data.get('curve', 0.3), 0.3, 0.0, 1.0),
-                'behavior': ai_data.get('behavior', 'standard')
-            }
-            
-            # Ensure behavior is valid
-            valid_behaviors = ['standard', 'predator', 'swarm', 'spiral']
-            if pattern['behavior'] not in valid_behaviors:
-                pattern['behavior'] = 'standard'
-            
-            interpretation = ai_data.get('interpretation', f'AI interpretation of "{emotion_text}"')
-            
-            return {
-                'pattern': pattern,
-                'interpretation': interpretation
-            }
-            
-        else:
-            raise ValueError("No valid JSON found in AI response")
-            
-    except Exception as e:
-        print(f"⚠️  Failed to parse AI response: {e}")
-        # Fallback to simple analysis
-        return analyze_emotion_simple(emotion_text)
+        cleaned = clean_ai_data_batch(
+            [unique_texts[i] for i in pending],
+            [fetched[i][1] for i in pending]
+        )
+    except Exception:
+        logger.exception("⚠️  Batch cleaning failed, cleaning responses one by one")
+        cleaned = [clean_ai_data_or_fallback(unique_texts[i], fetched[i][1]) for i in pending]
+    
+    for i, pattern_data in zip(pending, cleaned):
+        results[i] = pattern_data
+    
+    for i, pattern_data in zip(pending, cleaned):
+        remember_pattern(unique_texts[i], fetched[i][2], pattern_data)
+    
+    # Fan the results back out to every copy of each emotion
+    results_by_key = dict(zip(unique, results))
+    return [results_by_key[normalize_emotion(text)] for text in emotion_texts]
+
+# Emotion keywords for the simple analyzer, matched against whole words.
+# Common inflections and compounds are listed explicitly since there's no
+# substring matching.
+HIGH_ENERGY_WORDS = frozenset({'excite', 'excites', 'excited', 'excitedly', 'exciting', 'excitement',
+                               'overexcited', 'unexcited', 'energetic', 'energetically', 'energy',
+                               'energies', 'energize', 'energized', 'energizing', 'energise',
+                               'energised', 'energising', 'manic', 'hyper', 'hyped', 'hyperactive',
+                               'hyperactivity', 'hyperventilate', 'hyperventilated',
+                               'hyperventilating', 'frantic', 'frantically', 'wild', 'wildly',
+                               'wilder', 'wildest', 'wildness'})
+ANGER_WORDS = frozenset({'angry', 'angrily', 'angrier', 'angriest', 'anger', 'angers', 'angered',
+                         'angering', 'rage', 'raged', 'rages', 'raging', 'rageful', 'enrage',
+                         'enraged', 'enrages', 'enraging', 'outrage', 'outraged', 'outrages',
+                         'outraging', 'outrageous', 'furious', 'furiously', 'furiousness', 'fury',
+                         'aggressive', 'aggressively', 'aggressiveness', 'aggression', 'aggressor',
+                         'violent', 'violently', 'violence'})
+SADNESS_WORDS = frozenset({'sad', 'sadly', 'sadder', 'saddest', 'sadden', 'saddens', 'saddened',
+                           'saddening', 'sadness', 'depress', 'depresses', 'depressed',
+                           'depressing', 'depressingly', 'depression', 'depressive', 'melancholy',
+                           'melancholic', 'sorrow', 'sorrows', 'sorrowed', 'sorrowing', 'sorrowful',
+                           'sorrowfully', 'grief', 'griefs', 'grieve', 'grieves', 'grieved',
+                           'grieving'})
+FEAR_WORDS = frozenset({'anxious', 'anxiously', 'anxiousness', 'overanxious', 'anxiety', 'nervous',
+                        'nervously', 'nervousness', 'scared', 'fear', 'fears', 'feared', 'fearful',
+                        'fearfully', 'fearing', 'fearless', 'afraid', 'panic', 'panics',
+                        'panicked', 'panicking', 'panicky'})
+LOVE_WORDS = frozenset({'love', 'loves', 'loved', 'beloved', 'unloved', 'loveless', 'lovesick',
+                        'lover', 'lovers', 'loving', 'lovingly', 'lovely', 'lovelier', 'loveliest',
+                        'loveliness', 'lovable', 'loveable', 'affection', 'affections',
+                        'affectionate', 'affectionately', 'romance', 'romances', 'romanced',
+                        'romancing', 'romantic', 'romantically', 'tender', 'tenderly',
+                        'tenderness', 'tenderhearted', 'caring', 'caringly', 'uncaring'})
+JOY_WORDS = frozenset({'happy', 'happily', 'happier', 'happiest', 'happiness', 'joy', 'joys',
+                       'joyful', 'joyfully', 'joyfulness', 'joyous', 'joyously', 'joyless',
+                       'overjoyed', 'enjoy', 'enjoys', 'enjoyed', 'enjoying', 'enjoyment',
+                       'enjoyable', 'cheerful', 'cheerfully', 'cheerfulness', 'bliss', 'blissful',
+                       'blissfully', 'blissfulness', 'elated', 'elatedly'})
+CALM_WORDS = frozenset({'calm', 'calms', 'calmly', 'calmer', 'calmest', 'calmed', 'calming',
+                        'calmness', 'becalmed', 'peace', 'peaceful', 'peacefully', 'peacefulness',
+                        'serene', 'serenely', 'serenity', 'tranquil', 'tranquilly', 'tranquility',
+                        'tranquillity', 'tranquilize', 'tranquilized', 'tranquillize',
+                        'tranquillized', 'zen'})
+CONFUSION_WORDS = frozenset({'confuse', 'confuses', 'confused', 'confusedly', 'confusing',
+                             'confusion', 'chaos', 'chaotic', 'chaotically', 'disorder', 'disorders',
+                             'disordered', 'disorderly', 'random', 'randomly', 'randomness', 'lost'})
+# Forms that negate their category. The fallback still matches them the way the
+# old substring matcher did, but the program cache leaves them to Gemini.
+NEGATED_WORDS = frozenset({'unexcited', 'fearless', 'unloved', 'loveless', 'uncaring', 'joyless'})
 
-def analyze_emotion_simple(emotion_text):
-    """Simple fallback emotion analysis without AI"""
+# Categories in priority order: the first one found in the text wins
+EMOTION_KEYWORDS = {
+    'high_energy': HIGH_ENERGY_WORDS,
+    'anger': ANGER_WORDS,
+    'sadness': SADNESS_WORDS,
+    'fear': FEAR_WORDS,
+    'love': LOVE_WORDS,
+    'joy': JOY_WORDS,
+    'calm': CALM_WORDS,
+    'confusion': CONFUSION_WORDS,
+}
+
+# Every keyword the simple analyzer can answer for on its own, for the program cache
+EMOTION_WORDS = frozenset().union(*EMOTION_KEYWORDS.values()) - NEGATED_WORDS
+
+# One automaton over every keyword finds all categories in a single pass
+KEYWORD_AUTOMATON = ahocorasick.Automaton()
+for _category, _keywords in EMOTION_KEYWORDS.items():
+    for _keyword in _keywords:
+        KEYWORD_AUTOMATON.add_word(_keyword, (len(_keyword), _category))
+KEYWORD_AUTOMATON.make_automaton()
+
+def match_emotion_categories(text_lower):
+    """Return the categories whose keywords appear as whole words in the text"""
+    categories = set()
+    last = len(text_lower) - 1
+    for end, (length, category) in KEYWORD_AUTOMATON.iter(text_lower):
+        start = end - length + 1
+        if start > 0 and text_lower[start - 1].isalpha():
+            continue
+        if end < last and text_lower[end + 1].isalpha():
+            continue
+        categories.add(category)
+    return categories
+
+# Prebuilt patterns per category, copied only when returned
+DEFAULT_PATTERN = {'speed': 0.8, 'cohesion': 0.12, 'separation': 25, 'curve': 0.3, 'behavior': 'standard'}
+PATTERNS = {
+    'high_energy': {'speed': 1.8, 'cohesion': 0.12, 'separation': 25, 'curve': 0.8, 'behavior': 'swarm'},
+    'anger': {'speed': 1.5, 'cohesion': 0.12, 'separation': 45, 'curve': 0.3, 'behavior': 'predator'},
+    'sadness': {'speed': 0.4, 'cohesion': 0.05, 'separation': 25, 'curve': 0.1, 'behavior': 'standard'},
+    'fear': {'speed': 1.2, 'cohesion': 0.12, 'separation': 35, 'curve': 0.6, 'behavior': 'predator'},
+    'love': {'speed': 0.9, 'cohesion': 0.25, 'separation': 15, 'curve': 0.3, 'behavior': 'standard'},
+    'joy': {'speed': 1.3, 'cohesion': 0.18, 'separation': 25, 'curve': 0.5, 'behavior': 'swarm'},
+    'calm': {'speed': 0.6, 'cohesion': 0.08, 'separation': 25, 'curve': 0.2, 'behavior': 'standard'},
+    'confusion': {'speed': 1.0, 'cohesion': 0.12, 'separation': 20, 'curve': 0.9, 'behavior': 'spiral'},
+}
+INTERPRETATIONS = {
+    'high_energy': "High energy, chaotic movement",
+    'anger': "Aggressive, confrontational movement",
+    'sadness': "Slow, isolated, downward movement",
+    'fear': "Nervous, erratic, avoidant movement",
+    'love': "Gentle, clustering, harmonious movement",
+    'joy': "Joyful, bouncy, grouped movement",
+    'calm': "Slow, peaceful, flowing movement",
+    'confusion': "Chaotic, unpredictable movement",
+}
+
+def analyze_emotion_simple(emotion_text, require_match=False):
+    """Simple fallback emotion analysis without AI
     
-    text_lower = emotion_text.lower()
+    With require_match, returns None instead of the default pattern
+    when no emotion keyword is found.
+    """
     
-    # Default pattern
-    pattern = {
-        'speed': 0.8,
-        'cohesion': 0.12,
-        'separation': 25,
-        'curve': 0.3,
-        'behavior': 'standard'
-    }
+    categories = match_emotion_categories(emotion_text.lower())
     
-    interpretation = f"Simple pattern for '{emotion_text}'"
-    
-    # Analyze emotion keywords
-    
-    # High energy emotions
-    if any(word in text_lower for word in ['excited', 'energetic', 'manic', 'hyper', 'frantic', 'wild']):
-        pattern['speed'] = 1.8
-        pattern['curve'] = 0.8
-        pattern['behavior'] = 'swarm'
-        interpretation = "High energy, chaotic movement"
-    
-    # Anger/Aggression
-    elif any(word in text_lower for word in ['angry', 'rage', 'furious', 'aggressive', 'violent']):
-        pattern['speed'] = 1.5
-        pattern['separation'] = 45
-        pattern['behavior'] = 'predator'
-        interpretation = "Aggressive, confrontational movement"
-    
-    # Sadness/Depression
-    elif any(word in text_lower for word in ['sad', 'depressed', 'melancholy', 'sorrow', 'grief']):
-        pattern['speed'] = 0.4
-        pattern['curve'] = 0.1
-        pattern['cohesion'] = 0.05
-        interpretation = "Slow, isolated, downward movement"
-    
-    # Anxiety/Fear
-    elif any(word in text_lower for word in ['anxious', 'nervous', 'scared', 'fear', 'panic']):
-        pattern['speed'] = 1.2
-        pattern['separation'] = 35
-        pattern['curve'] = 0.6
-        pattern['behavior'] = 'predator'
-        interpretation = "Nervous, erratic, avoidant movement"
-    
-    # Love/Affection
-    elif any(word in text_lower for word in ['love', 'affection', 'romance', 'tender', 'caring']):
-        pattern['speed'] = 0.9
-        pattern['cohesion'] = 0.25
-        pattern['separation'] = 15
-        pattern['behavior'] = 'standard'
-        interpretation = "Gentle, clustering, harmonious movement"
-    
-    # Joy/Happiness
-    elif any(word in text_lower for word in ['happy', 'joy', 'cheerful', 'bliss', 'elated']):
-        pattern['speed'] = 1.3
-        pattern['cohesion'] = 0.18
-        pattern['curve'] = 0.5
-        pattern['behavior'] = 'swarm'
-        interpretation = "Joyful, bouncy, grouped movement"
-    
-    # Calm/Peace
-    elif any(word in text_lower for word in ['calm', 'peaceful', 'serene', 'tranquil', 'zen']):
-        pattern['speed'] = 0.6
-        pattern['curve'] = 0.2
-        pattern['cohesion'] = 0.08
-        interpretation = "Slow, peaceful, flowing movement"
-    
-    # Confusion/Chaos
-    elif any(word in text_lower for word in ['confused', 'chaos', 'disorder', 'random', 'lost']):
-        pattern['speed'] = 1.0
-        pattern['curve'] = 0.9
-        pattern['separation'] = 20
-        pattern['behavior'] = 'spiral'
-        interpretation = "Chaotic, unpredictable movement"
+    # Use the highest-priority category found in the text
+    category = next((name for name in EMOTION_KEYWORDS if name in categories), None)
+    
+    if category is None:
+        if require_match:
+            return None
+        return {
+            'pattern': DEFAULT_PATTERN.copy(),
+            'interpretation': f"Simple pattern for '{emotion_text}'"
+        }
     
     return {
-        'pattern': pattern,
-        'interpretation': interpretation
+        'pattern': PATTERNS[category].copy(),
+        'interpretation': INTERPRETATIONS[category]
     }
 
 @app.route('/', methods=['GET'])
-def home():
+async def home():
     """API documentation"""
     return jsonify({
         'message': 'Emotion Pattern API for "What is Life" Game',
         'endpoints': {
             '/generate-emotion-pattern': 'POST - Generate dot patterns from emotions',
+            '/generate-emotion-pattern/batch': f'POST - Generate patterns for up to {MAX_BATCH} emotions at once',
             '/health': 'GET - Check API health'
         },
         'example_request': {
@@ -287,9 +978,10 @@ if __name__ == '__main__':
     print()
     print("📋 Setup Steps:")
     print("1. Create .env file with your Gemini API key")
-    print("2. Install: pip install flask flask-cors google-generativeai python-dotenv")
+    print("2. Install: pip install -r requirements.txt")
     print("3. Get API key from: https://makersuite.google.com/app/apikey")
     print()
     print("🌐 Starting server on http://localhost:5000")
+    print("🚀 For production: hypercorn app:app --bind 0.0.0.0:5000 --workers 1 --worker-class asyncio")
     
     app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file